@@ -1,13 +1,51 @@
 import maya.cmds as cmds
 import maya.mel as mel
+import maya.OpenMayaUI as omui
 import json
 import os
-import glob
+
+try:
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtGui import QImageReader
+    from PySide6.QtWidgets import QWidget
+    from shiboken6 import wrapInstance
+except ImportError:
+    try:
+        from PySide2.QtCore import QEvent, QObject, QTimer
+        from PySide2.QtGui import QImageReader
+        from PySide2.QtWidgets import QWidget
+        from shiboken2 import wrapInstance
+    except ImportError:
+        QImageReader = None
+        QObject = None
+
+try:
+    import orjson  # Optional, faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
+if QObject is not None:
+    class ResizeEventFilter(QObject):
+        """Call back once a widget has stopped resizing."""
+        def __init__(self, widget, callback, delay=50):
+            super().__init__(widget)
+            self.timer = QTimer(self)
+            self.timer.setSingleShot(True)
+            self.timer.setInterval(delay)
+            self.timer.timeout.connect(callback)
+
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Resize:
+                self.timer.start()  # Restarting the timer coalesces a drag into a single callback
+            return False
+else:
+    ResizeEventFilter = None
 
 class FloatingShelfStatics:
     title = "Floating Shelf"
-    version = "101"
+    version = (1, 1, 0)
     version_flags = "-beta"
+    version_string = ".".join(map(str, version)) + version_flags
 
     window_name = "floatingShelfUI"
     dock_name = "floatingShelfDock"
@@ -23,32 +61,93 @@ class FloatingShelfStatics:
         "add_button": "addClip_100.png",
         "info": "info.png",
     }
-    SHELF_PREFS_PATH = os.path.join(cmds.internalVar(userPrefDir=True), "floating_shelves.json")
+    ICON_EXTENSIONS = (".png", ".svg", ".bmp", ".jpg", ".jpeg", ".xpm")
+    icon_cache = None  # Sorted icon names, the icon search paths don't change during a session
+    code_cache = {}  # Python command source -> compiled code object
+
+    SHELF_PREFS_FILE = "floating_shelves.json"
+    _prefs_path = None  # Resolved on first use, to avoid querying Maya at import time
+
+    @classmethod
+    def get_prefs_path(cls):
+        if cls._prefs_path is None:
+            cls._prefs_path = os.path.join(cmds.internalVar(userPrefDir=True), cls.SHELF_PREFS_FILE)
+        return cls._prefs_path
 
     @staticmethod
     def get_version():
-        return ".".join(FloatingShelfStatics.version) + FloatingShelfStatics.version_flags
+        return FloatingShelfStatics.version_string
 
 class FloatingShelfUI:
+    # Whether the window and dock exist, shared by all instances as each toggle creates a new one
+    # None means unknown, e.g. after the module is reloaded, and is resolved by querying Maya once
+    _window_alive = None
+    _dock_alive = None
+
+    @classmethod
+    def is_window_alive(cls):
+        if cls._window_alive is None:
+            cls._window_alive = cmds.window(FloatingShelfStatics.window_name, exists=True)
+        return cls._window_alive
+
+    @classmethod
+    def is_dock_alive(cls):
+        if cls._dock_alive is None:
+            cls._dock_alive = cmds.dockControl(FloatingShelfStatics.dock_name, exists=True)
+        return cls._dock_alive
+
+    @classmethod
+    def on_window_deleted(cls):
+        """Called by Maya when the window is deleted."""
+        cls._window_alive = False
+
+    @classmethod
+    def on_dock_deleted(cls):
+        """Called by Maya when the dock is deleted."""
+        cls._dock_alive = False
+
     # Helpers to load and save preferences
     @staticmethod
     def load_shelf_prefs():
-        """Load the shelf preferences from the JSON file."""
-        if os.path.exists(FloatingShelfStatics.SHELF_PREFS_PATH):
+        """Load the shelf preferences from the JSON file, returns None if it is missing or corrupted."""
+        prefs_path = FloatingShelfStatics.get_prefs_path()
+        if os.path.exists(prefs_path):
             try:
-                with open(FloatingShelfStatics.SHELF_PREFS_PATH, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                if orjson is not None:
+                    with open(prefs_path, "rb") as f:
+                        prefs = orjson.loads(f.read())
+                else:
+                    with open(prefs_path, "r", encoding="utf-8") as f:
+                        prefs = json.load(f)
+
+                # Older preferences stored the default shelf name as a "_default" entry alongside the shelves
+                if not isinstance(prefs.get("shelves"), dict):
+                    default_shelf = prefs.pop("_default", "Default")
+                    prefs = {"shelves": prefs, "default": default_shelf}
+                return prefs
+            except ValueError:  # Base of both json.JSONDecodeError and orjson.JSONDecodeError
                 cmds.warning("Corrupted shelf preferences detected. Resetting preferences.")
-        # Return a clean default state if file is missing or corrupted
-        return {"Default": [], "_default": "Default"}
+        return None
 
     @staticmethod
     def save_shelf_prefs(shelf_data):
+        """Save the shelf preferences to the JSON file."""
+        # Compact output from both backends, the stdlib only uses its C encoder when there is no indent
+        if orjson is not None:
+            data = orjson.dumps(shelf_data)
+        else:
+            data = json.dumps(shelf_data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+        # Write to a temporary file and swap it in, so an interrupted write can't corrupt the preferences
+        prefs_path = FloatingShelfStatics.get_prefs_path()
+        temp_path = prefs_path + ".tmp"
         try:
-            with open(FloatingShelfStatics.SHELF_PREFS_PATH, "w") as f:
-                json.dump(shelf_data, f, indent=4)
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, prefs_path)
         except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             cmds.error("Failed to save preferences: {}".format(e))
             raise
 
@@ -67,45 +166,60 @@ class FloatingShelfUI:
     def __init__(self):
         # Toggle the window if it is already open with each activation
         # Note: without evalDeferred, Maya will hard crash when closing the window due to the layoutDialog not being closed yet
-        if cmds.dockControl(FloatingShelfStatics.dock_name, exists=True):
-            cmds.layoutDialog(dismiss="Close")
-            cmds.evalDeferred(lambda: self.delete_ui(), lowestPriority=True)
-            return
-        if cmds.window(FloatingShelfStatics.window_name, exists=True):
+        if self.is_dock_alive() or self.is_window_alive():
             cmds.layoutDialog(dismiss="Close")
             cmds.evalDeferred(lambda: self.delete_ui(), lowestPriority=True)
             return
 
-        self.shelves = self.load_shelf_prefs()
-        self.default_shelf = self.shelves.get("_default", "Default")
+        prefs = self.load_shelf_prefs()
+        self._prefs_dirty = prefs is None  # Only write on startup if needed, e.g. to replace a missing or corrupted file
+        if prefs is None:
+            prefs = {"shelves": {"Default": []}, "default": "Default"}
+        self.shelves = prefs.get("shelves", {})  # Shelf name -> list of button data
+        self.default_shelf = prefs.get("default", "Default")
         self.last_window_width = None  # Track the last window width for resize handling
+        self._resize_filter = None  # Qt event filter watching the layout for resizes
+        self._reload_scheduled = False  # A deferred shelf rebuild is pending
+        self._save_scheduled = False  # A deferred preferences write is pending
+        self._button_controls = []  # shelfButton controls, aligned with the current shelf's button data
+        self._move_menu_items = {}  # shelfButton control -> (Move Left, Move Right) menu items
+        self._last_menu_shelves = None  # Shelf names currently in the dropdown menu
+        self._index_cache = {}  # id(button_data) -> index in the current shelf, avoids list.index dict comparisons
 
         # Ensure at least one shelf exists
         if not self.shelves or "Default" not in self.shelves:
             cmds.warning("No shelves found. Creating a 'Default' shelf.")
-            self.shelves = {"Default": [], "_default": "Default"}
-            self.save_shelf_prefs(self.shelves)
+            self.shelves = {"Default": []}
+            self.default_shelf = "Default"
+            self._prefs_dirty = True
 
         # Validate the default shelf
         if self.default_shelf not in self.shelves:
             cmds.warning(f"Default shelf '{self.default_shelf}' not found. Switching to 'Default'.")
             self.default_shelf = "Default"
-            self.shelves["_default"] = "Default"
+            self._prefs_dirty = True
 
         self.current_shelf = self.default_shelf
-        self.save_shelf_prefs(self.shelves)
+        if self._prefs_dirty:
+            self.save_shelf_prefs(self.get_prefs_data())
+            self._prefs_dirty = False
         self.create_ui()
 
     def delete_ui(self):
         """Delete the main UI window."""
+        # Query Maya directly here, the dock may already have been deleted along with its content window
         if cmds.window(FloatingShelfStatics.window_name, exists=True):
             cmds.deleteUI(FloatingShelfStatics.window_name, window=True)
         if cmds.dockControl(FloatingShelfStatics.dock_name, exists=True):
             cmds.deleteUI(FloatingShelfStatics.dock_name, control=True)
+        FloatingShelfUI._window_alive = False
+        FloatingShelfUI._dock_alive = False
 
     def create_ui(self):
         """Create the main floating shelf UI as a dockable window."""
         self.window = cmds.window(FloatingShelfStatics.window_name, title="Floating Shelf", sizeable=True, widthHeight=(400, 300))
+        FloatingShelfUI._window_alive = True
+        cmds.scriptJob(uiDeleted=[self.window, FloatingShelfUI.on_window_deleted])
         self.layout = cmds.formLayout("floatingShelfLayout", parent=self.window)
 
         # Top toolbar
@@ -118,12 +232,16 @@ class FloatingShelfUI:
         )
         self.shelf_menu = cmds.optionMenu(parent=self.toolbar, changeCommand=self.change_shelf)
         self.update_dropdown_menu()
-        cmds.iconTextButton(image=FloatingShelfStatics.ICONS["add_shelf"], ann="Add New Shelf", width=25, height=25, command=self.add_shelf)
-        cmds.iconTextButton(image=FloatingShelfStatics.ICONS["set_default"], ann="Set Default Shelf", width=25, height=25, command=self.set_default_shelf)
-        cmds.iconTextButton(image=FloatingShelfStatics.ICONS["move_up"], ann="Move Shelf Up", width=25, height=25, command=self.move_shelf_up)
-        cmds.iconTextButton(image=FloatingShelfStatics.ICONS["rename_shelf"], ann="Rename Shelf", width=25, height=25, command=self.rename_shelf)
-        cmds.iconTextButton(image=FloatingShelfStatics.ICONS["delete_shelf"], ann="Delete Shelf", width=25, height=25, command=self.delete_shelf)
-        cmds.iconTextButton(image=FloatingShelfStatics.ICONS["info"], ann="About", width=25, height=25, command=self.about)
+        toolbar_buttons = [
+            ("add_shelf", "Add New Shelf", self.add_shelf),
+            ("set_default", "Set Default Shelf", self.set_default_shelf),
+            ("move_up", "Move Shelf Up", self.move_shelf_up),
+            ("rename_shelf", "Rename Shelf", self.rename_shelf),
+            ("delete_shelf", "Delete Shelf", self.delete_shelf),
+            ("info", "About", self.about),
+        ]
+        for icon, tooltip, command in toolbar_buttons:
+            cmds.iconTextButton(parent=self.toolbar, image=FloatingShelfStatics.ICONS[icon], ann=tooltip, width=25, height=25, command=command)
 
         # Scrollable layout for shelf buttons
         self.scroll_layout = cmds.scrollLayout(parent=self.layout, childResizable=True)
@@ -161,29 +279,41 @@ class FloatingShelfUI:
             floating=True,
             closeCommand = lambda: self.delete_ui()
         )
+        FloatingShelfUI._dock_alive = True
+        cmds.scriptJob(uiDeleted=[FloatingShelfStatics.dock_name, FloatingShelfUI.on_dock_deleted])
 
-        self.monitor_window_resize()
+        # Size the grid once, further updates are driven by resize events
+        self.watch_resize()
+        self.on_resize()
 
     def close_menu(self, *_):
         """Close the floating shelf window."""
-        cmds.deleteUI(self.window, window=True)
-        if cmds.dockControl(FloatingShelfStatics.dock_name, exists=True):
-            cmds.deleteUI(FloatingShelfStatics.dock_name, control=True)
-
-    def monitor_window_resize(self):
-        """Monitor window resizing."""
-        if not cmds.window(self.window, exists=True):
+        self.delete_ui()
+
+    def watch_resize(self):
+        """Call on_resize whenever the layout is resized."""
+        if ResizeEventFilter is not None:
+            ptr = omui.MQtUtil.findLayout(self.layout)
+            if ptr:
+                widget = wrapInstance(int(ptr), QWidget)
+                self._resize_filter = ResizeEventFilter(widget, self.on_resize)
+                widget.installEventFilter(self._resize_filter)
+                return
+
+        # Without Qt, fall back to the scroll layout's resize callback
+        cmds.scrollLayout(self.scroll_layout, edit=True, resizeCommand=self.on_resize)
+
+    def on_resize(self, *_):
+        """Handle the window being resized."""
+        if not cmds.formLayout(self.layout, exists=True):
             return
 
-        if cmds.formLayout(self.layout, exists=True):
-            window_width = cmds.formLayout(self.layout, query=True, width=True)
+        window_width = cmds.formLayout(self.layout, query=True, width=True)
 
-            # Check if the width has changed (ignore None on the first run)
-            if self.last_window_width is None or self.last_window_width != window_width:
-                self.update_grid_columns(window_width)
-                self.last_window_width = window_width
-
-        cmds.evalDeferred(lambda: self.monitor_window_resize(), lp=True)
+        # Only update the grid if the width has actually changed
+        if window_width != self.last_window_width:
+            self.update_grid_columns(window_width)
+            self.last_window_width = window_width
 
     def update_grid_columns(self, window_width):
         """Update number of columns in the grid layout."""
@@ -192,10 +322,13 @@ class FloatingShelfUI:
 
     def update_dropdown_menu(self):
         """Rebuild the dropdown menu with all shelves."""
-        cmds.optionMenu(self.shelf_menu, edit=True, deleteAllItems=True)  # Clear existing items
-        for shelf_name in self.shelves.keys():
-            if shelf_name != "_default":
+        # Only rebuild the items if the shelves or their order changed
+        shelf_names = tuple(self.shelves)
+        if shelf_names != self._last_menu_shelves:
+            cmds.optionMenu(self.shelf_menu, edit=True, deleteAllItems=True)  # Clear existing items
+            for shelf_name in shelf_names:
                 cmds.menuItem(label=shelf_name, parent=self.shelf_menu)
+            self._last_menu_shelves = shelf_names
 
         # Set the dropdown to the current shelf
         if self.current_shelf in self.shelves:
@@ -216,7 +349,7 @@ class FloatingShelfUI:
             if shelf_name and shelf_name not in self.shelves:
                 self.shelves[shelf_name] = []  # Add new shelf to data
                 self.current_shelf = shelf_name
-                self.save_shelf_prefs(self.shelves)
+                self._schedule_save()
                 self.update_dropdown_menu()  # Rebuild dropdown menu
                 self.load_shelf(shelf_name)  # Load the new shelf
             else:
@@ -255,12 +388,12 @@ class FloatingShelfUI:
             del self.shelves[self.current_shelf]
 
             # If the deleted shelf was the default, set a new default shelf
-            if self.current_shelf == self.shelves.get("_default"):
-                self.shelves["_default"] = "Default" if "Default" in self.shelves else next(iter(self.shelves.keys()))
+            if self.current_shelf == self.default_shelf:
+                self.default_shelf = "Default" if "Default" in self.shelves else next(iter(self.shelves.keys()))
 
             # Update to a safe shelf (Default or the first available one)
-            self.current_shelf = self.shelves["_default"]
-            self.save_shelf_prefs(self.shelves)
+            self.current_shelf = self.default_shelf
+            self._schedule_save()
 
             self.update_dropdown_menu()
             self.load_shelf(self.current_shelf)
@@ -276,17 +409,16 @@ class FloatingShelfUI:
             if new_name and new_name != self.current_shelf:
                 self.shelves[new_name] = self.shelves.pop(self.current_shelf)
                 if self.current_shelf == self.default_shelf:
-                    self.shelves["_default"] = new_name
+                    self.default_shelf = new_name
                 self.current_shelf = new_name
-                self.save_shelf_prefs(self.shelves)
+                self._schedule_save()
                 self.update_dropdown_menu()
                 self.load_shelf(new_name)
 
     def set_default_shelf(self, *_):
         """Set the current shelf as default."""
-        self.shelves["_default"] = self.current_shelf
         self.default_shelf = self.current_shelf
-        self.save_shelf_prefs(self.shelves)
+        self._schedule_save()
         cmds.inViewMessage(amg=f"Default shelf set to: {self.current_shelf}", pos="topCenter", fade=True)
 
     def move_shelf_up(self, *_):
@@ -299,33 +431,72 @@ class FloatingShelfUI:
         current_index = shelf_names.index(self.current_shelf)
         shelf_names[current_index], shelf_names[current_index - 1] = shelf_names[current_index - 1], shelf_names[current_index]
         self.shelves = {key: self.shelves[key] for key in shelf_names}
-        self.save_shelf_prefs(self.shelves)
+        self._schedule_save()
         self.update_dropdown_menu()
 
+    def _schedule_save(self):
+        """Coalesce preference writes so a burst of edits produces a single write."""
+        if self._save_scheduled:
+            return
+        self._save_scheduled = True
+        cmds.evalDeferred(self._flush_save, lowestPriority=True)
+
+    def _flush_save(self):
+        """Write the pending preferences to disk."""
+        self._save_scheduled = False
+        self.save_shelf_prefs(self.get_prefs_data())
+
+    def get_prefs_data(self):
+        """Return the preferences in the layout they are saved in."""
+        return {"shelves": self.shelves, "default": self.default_shelf}
+
+    def _schedule_reload(self):
+        """Coalesce shelf rebuilds so a burst of edits produces a single rebuild."""
+        if self._reload_scheduled:
+            return
+        self._reload_scheduled = True
+        cmds.evalDeferred(self._flush_reload, lowestPriority=True)
+
+    def _flush_reload(self):
+        """Rebuild the current shelf if the UI still exists."""
+        self._reload_scheduled = False
+        if cmds.gridLayout(self.button_grid, exists=True):
+            self.rebuild_shelves()
+
     def rebuild_shelves(self):
         # Clear and load the shelf
         self.clear_layout(self.button_grid)
+        self._button_controls = []
+        self._move_menu_items = {}
         for button_data in self.shelves.get(self.current_shelf, []):
-            self.create_button(button_data)
+            self._button_controls.append(self.create_button(button_data))
 
         # Add the "+" button
         self.create_add_button()
 
+    def rebuild_index_cache(self):
+        """Map each button in the current shelf to its index."""
+        self._index_cache = {id(button_data): i for i, button_data in enumerate(self.shelves.get(self.current_shelf, []))}
+
     def load_shelf(self, shelf_name):
         """Load all buttons for the given shelf."""
         if shelf_name not in self.shelves:
             cmds.warning(f"Shelf '{shelf_name}' does not exist. Switching to default shelf.")
-            self.current_shelf = self.shelves["_default"]
+            self.current_shelf = self.default_shelf
 
             # Ensure the default shelf exists
             if self.current_shelf not in self.shelves:
                 cmds.warning("Default shelf not found. Creating a new 'Default' shelf.")
-                self.shelves = {"Default": [], "_default": "Default"}
+                self.shelves = {"Default": []}
+                self.default_shelf = "Default"
                 self.current_shelf = "Default"
-                self.save_shelf_prefs(self.shelves)
+                self._schedule_save()
+
+        # Index the shelf now so lookups are valid before the deferred rebuild runs
+        self.rebuild_index_cache()
 
         # Clear and load the shelf
-        cmds.evalDeferred(lambda: self.rebuild_shelves())
+        self._schedule_reload()
 
     def change_shelf(self, shelf_name):
         """Handle switching to a different shelf."""
@@ -359,7 +530,7 @@ class FloatingShelfUI:
                 "type": "python",
             }
             self.shelves[self.current_shelf].append(button_data)
-            self.save_shelf_prefs(self.shelves)
+            self._schedule_save()
             self.load_shelf(self.current_shelf)
 
     def create_button(self, button_data):
@@ -381,33 +552,66 @@ class FloatingShelfUI:
 
         # Add a right-click menu for editing
         popup = cmds.popupMenu(parent=button)
-        cmds.menuItem(label="Move Left", command=lambda _: self.move_button_left(button_data), enable=self.can_move_button(button_data, -1))
-        cmds.menuItem(label="Move Right", command=lambda _: self.move_button_right(button_data), enable=self.can_move_button(button_data, 1))
-        cmds.menuItem(label="Set Label", command=lambda _: self.set_button_label(button_data))
-        cmds.menuItem(label="Set Tooltip", command=lambda _: self.set_button_tooltip(button_data))
+        move_left = cmds.menuItem(label="Move Left", command=lambda _: self.move_button_left(button_data), enable=self.can_move_button(button_data, -1))
+        move_right = cmds.menuItem(label="Move Right", command=lambda _: self.move_button_right(button_data), enable=self.can_move_button(button_data, 1))
+        self._move_menu_items[button] = (move_left, move_right)
+        cmds.menuItem(label="Set Label", command=lambda _: self.set_button_label(button_data, button))
+        cmds.menuItem(label="Set Tooltip", command=lambda _: self.set_button_tooltip(button_data, button))
         cmds.menuItem(label="Edit Command", command=lambda _: self.edit_button_command(button_data))
         cmds.menuItem(label="Change Icon", command=lambda _: self.change_button_icon(button_data, button))
         cmds.menuItem(label="Delete", command=lambda _: self.delete_button(button, button_data))
+        return button
 
     @staticmethod
     def run_button_command(button_data):
         """Run the command assigned to the button."""
         try:
+            command = button_data["command"]
+            if not command.strip():
+                return
             if button_data["type"] == "python":
-                exec(button_data["command"])
+                # Compile once and reuse the code object on subsequent presses
+                code = FloatingShelfStatics.code_cache.get(command)
+                if code is None:
+                    code = compile(command, "<floating-shelf-button>", "exec")
+                    FloatingShelfStatics.code_cache[command] = code
+                exec(code)
             elif button_data["type"] == "mel":
-                mel.eval(button_data["command"])
+                mel.eval(command)
         except Exception as e:
             cmds.warning(f"Failed to execute button command: {e}")
 
     def move_button(self, button_data, direction):
         """Move a button in the given direction."""
         shelf = self.shelves[self.current_shelf]
-        index = shelf.index(button_data)
-        if 0 <= index + direction < len(shelf):
-            shelf[index + direction], shelf[index] = shelf[index], shelf[index + direction]
-            self.save_shelf_prefs(self.shelves)
-            self.load_shelf(self.current_shelf)
+        index = self._index_cache.get(id(button_data))
+        if index is None:
+            return
+        new_index = index + direction
+        if 0 <= new_index < len(shelf):
+            shelf[new_index], shelf[index] = shelf[index], shelf[new_index]
+            self._index_cache[id(shelf[index])] = index
+            self._index_cache[id(shelf[new_index])] = new_index
+            self._schedule_save()
+
+            # Fall back to a full rebuild if the controls are out of sync with the data
+            controls = self._button_controls
+            if self._reload_scheduled or len(controls) != len(shelf):
+                self.load_shelf(self.current_shelf)
+                return
+
+            # Swap the two controls in place, gridLayout positions are 1-based
+            controls[new_index], controls[index] = controls[index], controls[new_index]
+            cmds.gridLayout(self.button_grid, edit=True, position=(controls[index], index + 1))
+            cmds.gridLayout(self.button_grid, edit=True, position=(controls[new_index], new_index + 1))
+            self.update_move_menu_items(index)
+            self.update_move_menu_items(new_index)
+
+    def update_move_menu_items(self, index):
+        """Refresh the enabled state of the move menu items for the button at the given index."""
+        move_left, move_right = self._move_menu_items[self._button_controls[index]]
+        cmds.menuItem(move_left, edit=True, enable=index > 0)
+        cmds.menuItem(move_right, edit=True, enable=index < len(self._button_controls) - 1)
 
     def move_button_left(self, button_data):
         cmds.evalDeferred(lambda:  self.move_button(button_data, -1))
@@ -417,29 +621,29 @@ class FloatingShelfUI:
 
     def can_move_button(self, button_data, direction):
         """Check if the button can be moved in the given direction."""
-        shelf = self.shelves[self.current_shelf]
-        index = shelf.index(button_data)
-        return 0 <= index + direction < len(shelf)
+        index = self._index_cache.get(id(button_data))
+        return index is not None and 0 <= index + direction < len(self.shelves[self.current_shelf])
 
-    def set_button_label(self, button_data):
+    def set_button_label(self, button_data, button):
         """Set a new label for the button."""
         result = cmds.promptDialog(title="Set Label", message="Enter Button Label:", text=button_data["label"], button=["OK", "Cancel"])
         if result == "OK":
             new_label = cmds.promptDialog(query=True, text=True)
             if new_label:
                 button_data["label"] = new_label
-                self.save_shelf_prefs(self.shelves)
-                self.load_shelf(self.current_shelf)
+                self._schedule_save()
+                # Only this button changed, so edit it in place rather than rebuilding the shelf
+                cmds.shelfButton(button, edit=True, imageOverlayLabel=new_label)
 
-    def set_button_tooltip(self, button_data):
-        """Set a new label for the button."""
+    def set_button_tooltip(self, button_data, button):
+        """Set a new tooltip for the button."""
         result = cmds.promptDialog(title="Set Tooltip", message="Enter Button Tooltip:", text=button_data["tooltip"], button=["OK", "Cancel"])
         if result == "OK":
             new_label = cmds.promptDialog(query=True, text=True)
             if new_label:
                 button_data["tooltip"] = new_label
-                self.save_shelf_prefs(self.shelves)
-                self.load_shelf(self.current_shelf)
+                self._schedule_save()
+                cmds.shelfButton(button, edit=True, ann=new_label)
 
     def create_button_command(self, button_data):
         main_layout = cmds.setParent(q=True)
@@ -480,10 +684,11 @@ class FloatingShelfUI:
             command_type = "python" if cmds.radioButtonGrp(command_type_radio, query=True, select=True) == 1 else "mel"
             new_command = cmds.scrollField(command_field, query=True, text=True)
 
-            # Update button data
+            # Update button data, dropping the compiled code for the old command
+            FloatingShelfStatics.code_cache.pop(button_data["command"], None)
             button_data["type"] = command_type
             button_data["command"] = new_command
-            self.save_shelf_prefs(self.shelves)
+            self._schedule_save()
 
             self.close_layout_dialog()
 
@@ -493,37 +698,57 @@ class FloatingShelfUI:
 
     @staticmethod
     def get_all_maya_icons():
+        if FloatingShelfStatics.icon_cache is not None:
+            return FloatingShelfStatics.icon_cache
+
         maya_icon_paths_str = os.getenv("MAYA_FILE_ICON_PATH", "")
         xbm_lang_paths_str = os.getenv("XBMLANGPATH", "")
         path_separator = ';' if os.name == 'nt' else ':'
         maya_icon_paths = maya_icon_paths_str.split(path_separator)
         xbm_lang_paths = xbm_lang_paths_str.split(path_separator)
-        all_paths = list(set(maya_icon_paths + xbm_lang_paths))
-        all_icons = []
-        image_extensions = ['*.png', '*.svg', '*.bmp', '*.jpg', '*.jpeg', '*.xpm']
+        all_paths = dict.fromkeys(maya_icon_paths + xbm_lang_paths)  # Remove duplicates, keeping search order
+        all_icons = set()
         for path in all_paths:
             if os.path.isdir(path):
-                for extension in image_extensions:
-                    icon_files = glob.glob(os.path.join(path, extension))
-                    all_icons.extend([os.path.basename(icon) for icon in icon_files])  # Extract only the filename
-        all_icons = list(set(all_icons))  # Remove duplicates
-        all_icons.sort()
+                # A single directory scan per path rather than a glob per extension
+                try:
+                    with os.scandir(path) as entries:
+                        all_icons.update(entry.name for entry in entries
+                                         if entry.name.lower().endswith(FloatingShelfStatics.ICON_EXTENSIONS) and entry.is_file())
+                except OSError:
+                    continue  # Skip unreadable directories
+        all_icons = sorted(all_icons)
+        FloatingShelfStatics.icon_cache = all_icons
         return all_icons
 
+    @staticmethod
+    def get_image_size(icon_path):
+        """Return the (width, height) of an image by reading its header, or None if it can't be read."""
+        if QImageReader is not None:
+            # Icons that aren't files on disk are looked up in Maya's Qt resources
+            reader = QImageReader(icon_path if os.path.isfile(icon_path) else ":/" + icon_path)
+            size = reader.size()
+            if size.isValid():
+                return size.width(), size.height()
+        return None
+
     def create_icon_browser(self, button_data, button):
         """Creates the icon browser for selecting an icon."""
         all_icons = self.get_all_maya_icons()
+        all_icons_lower = [icon.lower() for icon in all_icons]  # Lowercased once, not on every filter
+        shown_icons = all_icons  # The items currently in the list
 
         def update_icon_preview(*args):
             selected_icon = cmds.textScrollList(icon_list, query=True, selectItem=True)
             if selected_icon:
                 icon_path = selected_icon[0]  # Assuming the full path is stored in the list
 
-                # Create a temporary image plane to get the image size
-                temp_image_plane = cmds.imagePlane(fileName=icon_path)[0]
-                width = cmds.getAttr(temp_image_plane + ".width")
-                height = cmds.getAttr(temp_image_plane + ".height")
-                cmds.delete(temp_image_plane)  # Clean up the temporary image plane
+                # Read the image size from the file header, no need to decode the image
+                image_size = self.get_image_size(icon_path)
+                if not image_size or not all(image_size):
+                    cmds.image(image_control, edit=True, image=icon_path)
+                    return
+                width, height = image_size
 
                 # Define the maximum dimensions for the image control
                 max_width, max_height = 300, 150
@@ -539,15 +764,20 @@ class FloatingShelfUI:
                 cmds.image(image_control, edit=True, image=icon_path, width=new_width, height=new_height)
 
         def filter_icons(*args):
+            nonlocal shown_icons
             filter_text = cmds.textField(text_field, query=True, text=True).lower()
-            filtered_items = [icon for icon in all_icons if filter_text in icon.lower()]
-            cmds.textScrollList(icon_list, edit=True, removeAll=True)
-            cmds.textScrollList(icon_list, edit=True, append=filtered_items if filtered_items else all_icons)
+            filtered_items = [icon for icon, icon_lower in zip(all_icons, all_icons_lower) if filter_text in icon_lower] or all_icons
+
+            # Only repopulate the list if the results changed
+            if filtered_items != shown_icons:
+                cmds.textScrollList(icon_list, edit=True, removeAll=True)
+                cmds.textScrollList(icon_list, edit=True, append=filtered_items)
+                shown_icons = filtered_items
 
         def apply_icon_and_close(icon, *args):
             cmds.shelfButton(button, edit=True, image=icon)
             button_data["icon"] = icon
-            self.save_shelf_prefs(self.shelves)
+            self._schedule_save()
             self.close_layout_dialog()
 
         def browse_image(*args):
@@ -609,12 +839,13 @@ class FloatingShelfUI:
                 cmds.evalDeferred(lambda: cmds.deleteUI(button, control=True))
 
             # Check if the button data still exists in the shelf before attempting to modify the list
-            if button_data in self.shelves[self.current_shelf]:
-                self.shelves[self.current_shelf].remove(button_data)
+            index = self._index_cache.get(id(button_data))
+            if index is not None:
+                del self.shelves[self.current_shelf][index]
                 # Save the updated shelf preferences
-                self.save_shelf_prefs(self.shelves)
-                # Defer reloading the shelf to avoid potential conflicts caused by immediate UI changes
-                cmds.evalDeferred(lambda: self.load_shelf(self.current_shelf))
+                self._schedule_save()
+                # Reloading is deferred to avoid potential conflicts caused by immediate UI changes
+                self.load_shelf(self.current_shelf)
 
         except Exception as e:
             cmds.warning(f"Failed to delete button: {e}")